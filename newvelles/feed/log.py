@@ -1,7 +1,10 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, List
 
+import orjson
+
 from newvelles.models.grouping import VISUALIZATION_VERSION
 from newvelles.utils.s3 import upload_to_s3
 
@@ -36,26 +39,26 @@ def log_groups(grouped_sentences: Dict[int, List[str]], output_path: str = _LOG_
 def log_visualization(visualization_data, output_path: str = _LOG_PATH, s3: bool = False) -> str:
     current_datetime = _current_datetime()
     viz_file_name = f'{_LOG_VISUALIZATION_NAME}_{VISUALIZATION_VERSION}'
+    viz_bytes = orjson.dumps(visualization_data)
     log_path = f"{output_path}/{viz_file_name}_{current_datetime}.json"
-    with open(log_path, 'w') as f:
-        json.dump(visualization_data, f)
+    with open(log_path, 'wb') as f:
+        f.write(viz_bytes)
 
     if s3:
-        upload_to_s3(_S3_BUCKET, f'{viz_file_name}_{current_datetime}.json',
-                     json.dumps(visualization_data).encode('utf-8'))
+        upload_to_s3(_S3_BUCKET, f'{viz_file_name}_{current_datetime}.json', viz_bytes)
 
     log_path_latest = f"{_LATEST_PATH}/{_LOG_LATEST_VISUALIZATION_NAME}.json"
-    with open(log_path_latest, 'w') as f:
-        json.dump(visualization_data, f)
+    with open(log_path_latest, 'wb') as f:
+        f.write(viz_bytes)
 
     log_path_latest_current = f"./{_LOG_LATEST_VISUALIZATION_NAME}.json"
-    with open(log_path_latest_current, 'w') as f:
-        json.dump(visualization_data, f)
+    with open(log_path_latest_current, 'wb') as f:
+        f.write(viz_bytes)
 
     if s3:
         upload_to_s3(_S3_PUBLIC_BUCKET,
                      f'{_LOG_LATEST_VISUALIZATION_NAME}.json',
-                     json.dumps(visualization_data).encode('utf-8'),
+                     viz_bytes,
                      public_read=True)
 
     latest_metadata = {
@@ -64,13 +67,14 @@ def log_visualization(visualization_data, output_path: str = _LOG_PATH, s3: bool
         'latest_log_reference': log_path
     }
     log_path_latest_metadata = f"{_LATEST_PATH}/{_LOG_LATEST_VISUALIZATION_METADATA_NAME}.json"
-    with open(log_path_latest_metadata, 'w') as f:
-        json.dump(latest_metadata, f)
+    metadata_bytes = orjson.dumps(latest_metadata)
+    with open(log_path_latest_metadata, 'wb') as f:
+        f.write(metadata_bytes)
 
     if s3:
         upload_to_s3(_S3_PUBLIC_BUCKET,
                      f'{_LOG_LATEST_VISUALIZATION_METADATA_NAME}.json',
-                     json.dumps(latest_metadata).encode('utf-8'),
+                     metadata_bytes,
                      public_read=True)
 
     return log_path
@@ -80,19 +84,28 @@ def log_s3(visualization_data) -> str:
     current_datetime = _current_datetime()
     viz_file_name = f'{_LOG_VISUALIZATION_NAME}_{VISUALIZATION_VERSION}'
     s3_file_name = f'{viz_file_name}_{current_datetime}.json'
-    upload_to_s3(_S3_BUCKET, s3_file_name, json.dumps(visualization_data).encode('utf-8'))
-    upload_to_s3(_S3_PUBLIC_BUCKET,
-                 f'{_LOG_LATEST_VISUALIZATION_NAME}.json',
-                 json.dumps(visualization_data).encode('utf-8'),
-                 public_read=True)
-
+    viz_bytes = orjson.dumps(visualization_data)
     latest_metadata = {
         'datetime': current_datetime,
         'version': VISUALIZATION_VERSION
     }
-    upload_to_s3(_S3_PUBLIC_BUCKET,
-                 f'{_LOG_LATEST_VISUALIZATION_METADATA_NAME}.json',
-                 json.dumps(latest_metadata).encode('utf-8'),
-                 public_read=True)
+
+    # The three uploads are independent, so overlap their round trips.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        uploads = [
+            executor.submit(upload_to_s3, _S3_BUCKET, s3_file_name, viz_bytes),
+            executor.submit(upload_to_s3,
+                            _S3_PUBLIC_BUCKET,
+                            f'{_LOG_LATEST_VISUALIZATION_NAME}.json',
+                            viz_bytes,
+                            public_read=True),
+            executor.submit(upload_to_s3,
+                            _S3_PUBLIC_BUCKET,
+                            f'{_LOG_LATEST_VISUALIZATION_METADATA_NAME}.json',
+                            orjson.dumps(latest_metadata),
+                            public_read=True),
+        ]
+        for upload in uploads:
+            upload.result()
 
     return s3_file_name
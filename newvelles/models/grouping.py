@@ -12,10 +12,25 @@ from newvelles.utils.text import get_top_words_spacy, group_sentences, load_embe
 VISUALIZATION_VERSION = '0.2.1'
 DEBUG = debug()
 
-if os.environ.get('AWS_LAMBDA'):
-    _EMBEDDING_SP, _EMBEDDING_MODULE = load_embedding_model_lite()
-else:
-    _EMBEDDING_MODEL = load_embedding_model()
+# Embedding models are expensive to load (potentially downloading them first),
+# so they are loaded lazily on first use instead of at import time.
+_EMBEDDING_SP = None
+_EMBEDDING_MODULE = None
+_EMBEDDING_MODEL = None
+
+
+def _embedding_model_lite():  # pragma: no cover
+    global _EMBEDDING_SP, _EMBEDDING_MODULE
+    if _EMBEDDING_MODULE is None:
+        _EMBEDDING_SP, _EMBEDDING_MODULE = load_embedding_model_lite()
+    return _EMBEDDING_SP, _EMBEDDING_MODULE
+
+
+def _embedding_model():  # pragma: no cover
+    global _EMBEDDING_MODEL
+    if _EMBEDDING_MODEL is None:
+        _EMBEDDING_MODEL = load_embedding_model()
+    return _EMBEDDING_MODEL
 
 
 def generate_top_words(groups_indexes, similar_sets, sentences):
@@ -54,9 +69,10 @@ def build_visualization(
 
     # Depending on whether we are on AWS Lambda or not, we use different clustering algorithm
     if os.environ.get('AWS_LAMBDA'):
-        similar_sets, unique_sets = group_sentences_lite(_EMBEDDING_SP, _EMBEDDING_MODULE, titles)
+        embedding_sp, embedding_module = _embedding_model_lite()
+        similar_sets, unique_sets = group_sentences_lite(embedding_sp, embedding_module, titles)
     else:
-        similar_sets, unique_sets = group_sentences(_EMBEDDING_MODEL, titles)
+        similar_sets, unique_sets = group_sentences(_embedding_model(), titles)
 
     # TODO: consider removing title_groups (currently only used for debugging)
     title_groups = defaultdict(list)
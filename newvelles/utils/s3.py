@@ -2,7 +2,8 @@ import boto3
 
 
 def upload_to_s3(bucket_name: str, file_name: str, string_byte, public_read: bool = False) -> None:
-    s3_resource = boto3.resource('s3')
+    # boto3's default session is not thread-safe, so each call gets its own Session.
+    s3_resource = boto3.session.Session().resource('s3')
     s3_object = s3_resource.Object(bucket_name, file_name)
     s3_object.put(Body=string_byte)
     if public_read:
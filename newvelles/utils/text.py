@@ -1,6 +1,6 @@
 import os
 import re
-from collections import Counter
+from collections import Counter, defaultdict
 from typing import Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
@@ -119,6 +119,17 @@ def _process_to_IDs_in_sparse_format(sp, sentences):
     return values, indices, dense_shape
 
 
+# Patterns used by _clean_text / _clean_term, compiled once at module load so
+# per-sentence processing skips the re-cache lookup entirely.
+_NON_WORD_RE = re.compile(r"[^\w\-\'\s\.]")
+_DIGITS_RE = re.compile(r'\d|\_|\*')
+_LONE_DASH_RE = re.compile(r'(^|\s+)-(\s+|$)')
+_DOTS_RE = re.compile(r'\.+')
+_SPACES_RE = re.compile(r'\s+')
+_QUOTES_RE = re.compile(r'\'')
+_NON_ALPHANUM_RE = re.compile(r'[^A-Za-z0-9 ]+')
+
+
 def _clean_text(text):
     """
     General cleanup of anything that might not match a word.
@@ -129,14 +140,14 @@ def _clean_text(text):
     text = text.replace('<i>', '')  # skip / clean anything related to html
     text = text.replace('<\\i>', '')  # skip / clean anything related to html
 
-    text = re.sub(r"[^\w\-\'\s\.]", '',
-                  text)  # remove all non name related characters (\w, '-' and "'")
-    text = re.sub(r'\d|\_|\*', '', text)  # remove digits, '_' and '*' which are matched by \w
-    text = re.sub(r'(^|\s+)-(\s+|$)', '', text)  # remove "-" when not used in between a word
-    text = re.sub(r'\.+', ' ', text)  # remove "." when it's at the end of the sentence
-    text = re.sub(r'\s+', ' ', text).strip()  # clean all extra spaces
+    text = _NON_WORD_RE.sub('',
+                            text)  # remove all non name related characters (\w, '-' and "'")
+    text = _DIGITS_RE.sub('', text)  # remove digits, '_' and '*' which are matched by \w
+    text = _LONE_DASH_RE.sub('', text)  # remove "-" when not used in between a word
+    text = _DOTS_RE.sub(' ', text)  # remove "." when it's at the end of the sentence
+    text = _SPACES_RE.sub(' ', text).strip()  # clean all extra spaces
     if text.count("'") > 1:
-        text = re.sub(r'\'', '', text)
+        text = _QUOTES_RE.sub('', text)
     return text
 
 
@@ -155,17 +166,42 @@ def _remove_stopwords(sentence_tokens: Iterable[str]) -> Iterable[str]:
     yield from [x for x in sentence_tokens if x.lower() not in _STOPWORDS]
 
 
+def _apply_terms_mapping(sentence: str, terms_mapping: Dict[str, str]) -> str:
+    """
+    Replace every mapped term within a sentence (case insensitive).
+    """
+    for term, mapping in terms_mapping.items():
+        sentence = re.sub(rf'\b{term}\b', mapping, sentence, flags=re.I)
+    return sentence
+
+
 def process_content(sentence: str, terms_mapping: Optional[Dict[str, str]] = None) -> List[str]:
     """
     Process any input sentence using a dictionary of terms to be mapped, and returning
     a clean set of tokens excluding all stop words.
     """
     if terms_mapping:
-        for term, mapping in terms_mapping.items():
-            sentence = re.sub(rf'\b{term}\b', mapping, sentence, flags=re.I)
+        sentence = _apply_terms_mapping(sentence, terms_mapping)
     return list(_remove_stopwords(_tokenizer(_clean_text(sentence))))
 
 
+def process_content_batch(sentences: List[str],
+                          terms_mapping: Optional[Dict[str, str]] = None) -> List[List[str]]:
+    """
+    Process a collection of sentences in one pass.
+
+    Equivalent to calling process_content per sentence, but with the cleanup,
+    tokenization and stopword filtering inlined and bound to locals so the
+    per-call setup is paid once per batch instead of once per sentence.
+    """
+    if terms_mapping:
+        sentences = [_apply_terms_mapping(sentence, terms_mapping) for sentence in sentences]
+    clean_text = _clean_text
+    stopwords = _STOPWORDS
+    return [[token for token in clean_text(sentence).split(' ') if token.lower() not in stopwords]
+            for sentence in sentences]
+
+
 def load_embedding_model_lite(
         embeddings_path: Optional[str] = _EMBEDDINGS_PATH_LITE):  # pragma: no cover
     """
@@ -224,42 +260,102 @@ def _group_sentences(sparse_matrix, threshold):
 
 
 def remove_subsets(all_sets):
-    sets = sorted(all_sets, key=lambda x: len(x), reverse=False)
+    sets = sorted(all_sets, key=len, reverse=False)
+    # 64-bit fingerprint per set: if a is a subset of b, mask(a) must be fully
+    # contained in mask(b), so a single bitwise check rejects most pairs
+    # before any set objects are built.
+    masks = []
+    frozen = []
+    for current_set in sets:
+        mask = 0
+        for element in current_set:
+            mask |= 1 << (hash(element) & 63)
+        masks.append(mask)
+        frozen.append(frozenset(current_set))
     final_sets = []
-    for i, _ in enumerate(sets):
+    for i, current_set in enumerate(sets):
         skip = False
-        for s in sets[i + 1:]:
-            if not skip and len(set(sets[i]).difference(set(s))) == 0:
-                final_sets.append(s)
+        current_mask = masks[i]
+        current_frozen = frozen[i]
+        for j in range(i + 1, len(sets)):
+            if current_mask & masks[j] != current_mask:
+                continue
+            if current_frozen <= frozen[j]:
+                final_sets.append(sets[j])
                 skip = True
+                break
         if not skip:
-            final_sets.append(sets[i])
+            final_sets.append(current_set)
     return set(map(tuple, final_sets))
 
 
-def _remove_similar_subsets(all_sets):
-    sets = sorted(all_sets, key=lambda x: len(x), reverse=False)
-    final_sets = []
-    for i, _ in enumerate(sets):
-        skip = False
-        for s in sets[i + 1:]:
-            if not skip and len(set(sets[i]).intersection(set(s))) > 0:
-                final_sets.append(sorted(set(sets[i]).union(set(s))))
-                skip = True
-        if not skip:
-            final_sets.append(sorted(sets[i]))
-    return set(map(tuple, final_sets))
+def _find(parent, element):
+    """
+    Find the root of an element, compressing the path along the way.
+    """
+    while parent[element] != element:
+        parent[element] = parent[parent[element]]
+        element = parent[element]
+    return element
+
+
+def _union(parent, size, element1, element2):
+    """
+    Merge the components containing both elements (union by size).
+    """
+    root1 = _find(parent, element1)
+    root2 = _find(parent, element2)
+    if root1 == root2:
+        return
+    if size[root1] < size[root2]:
+        root1, root2 = root2, root1
+    parent[root2] = root1
+    size[root1] += size[root2]
 
 
 def remove_similar_subsets(all_sets):
+    """
+    Merge all sets that (transitively) share at least one element, so each
+    output group is the union of all input sets connected through overlaps.
+
+    Uses a disjoint-set (union-find) structure over the elements, which is
+    near-linear in the total number of elements instead of the quadratic
+    pairwise intersection scan this used to do.
+    """
     if not all_sets:
         return set(all_sets)
-    while True:
-        output = _remove_similar_subsets(all_sets)
-        if _compare_sets(output, all_sets):
-            break
-        all_sets = output
-    return all_sets
+    # Inputs often contain the exact same set several times; collapse the
+    # duplicates up front so each distinct set is walked only once.
+    unique_sets = {frozenset(current_set): current_set for current_set in all_sets}.values()
+    # Map elements to dense indices so the union-find runs over flat lists
+    # (plain array indexing) instead of per-element dict lookups.
+    index: Dict = {}
+    elements: List = []
+    indexed_sets = []
+    for current_set in unique_sets:
+        indexed = []
+        for element in current_set:
+            idx = index.get(element)
+            if idx is None:
+                idx = len(elements)
+                index[element] = idx
+                elements.append(element)
+            indexed.append(idx)
+        if indexed:
+            indexed_sets.append(indexed)
+    parent = list(range(len(elements)))
+    size = [1] * len(elements)
+    for indexed in indexed_sets:
+        first = indexed[0]
+        for idx in indexed[1:]:
+            _union(parent, size, first, idx)
+    groups = defaultdict(list)
+    for idx, element in enumerate(elements):
+        groups[_find(parent, idx)].append(element)
+    output = {tuple(sorted(group)) for group in groups.values()}
+    if _compare_sets(output, all_sets):
+        return all_sets
+    return output
 
 
 def _compare_sets(set1, set2):
@@ -270,8 +366,8 @@ def _compare_sets(set1, set2):
 
 def get_top_words(sentences: List[str], top_n: int = 10) -> List[Tuple[str, int]]:
     words = Counter()
-    for sentence in sentences:
-        words.update(process_content(sentence))
+    for tokens in process_content_batch(sentences):
+        words.update(tokens)
     return sorted(words.items(), key=lambda x: x[1], reverse=True)[:top_n]
 
 
@@ -293,7 +389,7 @@ def _clean_term(term: str) -> str:
     """
     Return lower case removing all keeping all alphanumeric or spaces.
     """
-    return re.sub(r'[^A-Za-z0-9 ]+', '', term.lower()).strip()
+    return _NON_ALPHANUM_RE.sub('', term.lower()).strip()
 
 
 def get_top_words_spacy(sentences: List[str], top_n: int = 5) -> List[Tuple[str, int]]:
@@ -0,0 +1,24 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from newvelles.utils.s3 import upload_to_s3
+
+
+class TestUploadToS3(unittest.TestCase):
+    def setUp(self):
+        patcher = patch('newvelles.utils.s3.boto3.session.Session')
+        self.mock_resource = patcher.start().return_value.resource
+        self.addCleanup(patcher.stop)
+        self.mock_object = Mock()
+        self.mock_resource.return_value.Object.return_value = self.mock_object
+
+    def test_upload(self):
+        upload_to_s3('test-bucket', 'file.json', b'{}')
+        self.mock_resource.return_value.Object.assert_called_once_with('test-bucket', 'file.json')
+        self.mock_object.put.assert_called_once_with(Body=b'{}')
+        self.mock_object.Acl.assert_not_called()
+
+    def test_upload_public_read(self):
+        upload_to_s3('test-bucket', 'file.json', b'{}', public_read=True)
+        self.mock_object.put.assert_called_once_with(Body=b'{}')
+        self.mock_object.Acl.return_value.put.assert_called_once_with(ACL='public-read')